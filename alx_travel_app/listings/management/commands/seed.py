@@ -20,17 +20,16 @@ Key Concepts:
 - BaseCommand: Base class for all Django management commands
 - handle(): Main method that executes the command logic
 - options: Dictionary containing parsed command-line arguments
-- get_or_create(): Django ORM method that gets existing or creates new objects
+- bulk_create(): Django ORM method that inserts many objects in a single query
 """
 
 from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
+from django.core.management.color import no_style
+from django.db import connection, transaction
 from django.utils import timezone
 from datetime import timedelta
 from decimal import Decimal
-from listings.models import Listing, Booking, Review
-
-User = get_user_model()
+from listings.models import Listing, Booking, Review, User
 
 
 class Command(BaseCommand):
@@ -65,29 +64,55 @@ class Command(BaseCommand):
             *args: Positional arguments (not used here)
             **options: Dictionary of command-line options
         """
-        if options['clear']:
-            self.stdout.write(self.style.WARNING('Clearing existing data...'))
-            Review.objects.all().delete()
-            Booking.objects.all().delete()
-            Listing.objects.all().delete()
-            # Note: We don't delete users to avoid breaking authentication
-            self.stdout.write(self.style.SUCCESS('Existing data cleared!'))
+        # Run the whole seed in one transaction: everything commits once at
+        # the end, and a failure part-way through leaves the database untouched
+        with transaction.atomic():
+            if options['clear']:
+                self.stdout.write(self.style.WARNING('Clearing existing data...'))
+                self.clear_data()
+                # Note: We don't delete users to avoid breaking authentication
+                self.stdout.write(self.style.SUCCESS('Existing data cleared!'))
 
-        self.stdout.write(self.style.SUCCESS('Starting to seed database...'))
+            self.stdout.write(self.style.SUCCESS('Starting to seed database...'))
 
-        # Step 1: Create or get users
-        users = self.create_users()
+            # Step 1: Create or get users
+            users = self.create_users()
         
-        # Step 2: Create listings
-        listings = self.create_listings()
+            # Step 2: Create listings
+            listings = self.create_listings()
         
-        # Step 3: Create bookings (requires listings and users)
-        self.create_bookings(listings, users)
+            # Step 3: Create bookings (requires listings and users)
+            self.create_bookings(listings, users)
         
-        # Step 4: Create reviews (requires listings)
-        self.create_reviews(listings, users)
+            # Step 4: Create reviews (requires listings)
+            self.create_reviews(listings, users)
+
+            self.stdout.write(self.style.SUCCESS('Database seeding completed successfully!'))
+
+    def clear_data(self):
+        """
+        Delete all listings, bookings and reviews.
 
-        self.stdout.write(self.style.SUCCESS('Database seeding completed successfully!'))
+        On PostgreSQL the tables are truncated in one statement, which is
+        transactional there and doesn't scale with the number of rows (no
+        delete signals are sent). Other databases fall back to ORM deletes,
+        since e.g. MySQL's TRUNCATE would commit the surrounding transaction.
+        """
+        if connection.vendor == 'postgresql':
+            # sql_flush builds the backend's own TRUNCATE ... CASCADE statement
+            tables = [model._meta.db_table for model in (Review, Booking, Listing)]
+            statements = connection.ops.sql_flush(
+                no_style(), tables, reset_sequences=True, allow_cascade=True
+            )
+            connection.ops.execute_sql_flush(statements)
+            return
+
+        # Nothing references reviews, so skip the collector and
+        # delete signals and issue a plain DELETE
+        reviews = Review.objects.all()
+        reviews._raw_delete(reviews.db)
+        Booking.objects.all().delete()
+        Listing.objects.all().delete()
 
     def create_users(self):
         """
@@ -104,21 +129,30 @@ class Command(BaseCommand):
             {'username': 'bob_wilson', 'email': 'bob@example.com'},
         ]
         
-        users = []
-        for user_data in users_data:
-            # get_or_create returns (object, created) tuple
-            user, created = User.objects.get_or_create(
-                username=user_data['username'],
-                defaults={'email': user_data['email']}
-            )
-            if created:
-                # Set a default password for created users
-                user.set_password('password123')
-                user.save()
-                self.stdout.write(f'  ✓ Created user: {user.username}')
-            else:
-                self.stdout.write(f'  → User already exists: {user.username}')
-            users.append(user)
+        # Fetch every existing user in one query instead of a
+        # get_or_create (SELECT + INSERT) per user
+        wanted = {user_data['username']: user_data for user_data in users_data}
+        existing = User.objects.filter(username__in=wanted).in_bulk(field_name='username')
+
+        # Collect the progress lines and write them once at the end, rather
+        # than a write (and flush) per row
+        lines = []
+        missing = []
+        for username, user_data in wanted.items():
+            if username in existing:
+                lines.append(f'  → User already exists: {username}')
+                continue
+            user = User(username=username, email=user_data['email'])
+            # bulk_create() doesn't call save(), so hash the password up front
+            user.set_password('password123')
+            missing.append(user)
+            lines.append(f'  ✓ Created user: {username}')
+        User.objects.bulk_create(missing)
+        self.stdout.write('\n'.join(lines))
+
+        # Re-fetch so every user has its primary key, keeping the input order
+        by_username = User.objects.filter(username__in=wanted).in_bulk(field_name='username')
+        users = [by_username[username] for username in wanted]
         
         return users
 
@@ -159,17 +193,29 @@ class Command(BaseCommand):
             },
         ]
         
-        listings = []
-        for listing_data in listings_data:
-            listing, created = Listing.objects.get_or_create(
-                title=listing_data['title'],
-                defaults=listing_data
-            )
-            if created:
-                self.stdout.write(f'  ✓ Created listing: {listing.title}')
-            else:
-                self.stdout.write(f'  → Listing already exists: {listing.title}')
-            listings.append(listing)
+        # Same pattern as create_users, matching on title. Titles aren't
+        # unique, so build the lookup by hand rather than with in_bulk()
+        wanted = {listing_data['title']: listing_data for listing_data in listings_data}
+        existing = {
+            listing.title: listing
+            for listing in Listing.objects.filter(title__in=wanted)
+        }
+
+        lines = []
+        missing = []
+        for title, listing_data in wanted.items():
+            if title in existing:
+                lines.append(f'  → Listing already exists: {title}')
+                continue
+            missing.append(Listing(**listing_data))
+            lines.append(f'  ✓ Created listing: {title}')
+        # UUID primary keys are generated client-side, so the new instances
+        # are usable straight away without re-fetching them
+        Listing.objects.bulk_create(missing)
+        self.stdout.write('\n'.join(lines))
+
+        existing.update((listing.title, listing) for listing in missing)
+        listings = [existing[title] for title in wanted]
         
         return listings
 
@@ -191,42 +237,48 @@ class Command(BaseCommand):
                 'user': users[0],  # john_doe
                 'start_date': today + timedelta(days=5),
                 'end_date': today + timedelta(days=8),
-                'status': 'confirmed',
+                'status': Booking.Status.CONFIRMED,
             },
             {
                 'listing': listings[1],  # Mountain Cabin
                 'user': users[1],  # jane_smith
                 'start_date': today + timedelta(days=10),
                 'end_date': today + timedelta(days=12),
-                'status': 'pending',
+                'status': Booking.Status.PENDING,
             },
             {
                 'listing': listings[2],  # Downtown Apartment
                 'user': users[0],  # john_doe
                 'start_date': today + timedelta(days=15),
                 'end_date': today + timedelta(days=18),
-                'status': 'confirmed',
+                'status': Booking.Status.CONFIRMED,
             },
             {
                 'listing': listings[0],  # Beachfront Villa
                 'user': users[2],  # bob_wilson
                 'start_date': today + timedelta(days=20),
                 'end_date': today + timedelta(days=25),
-                'status': 'pending',
+                'status': Booking.Status.PENDING,
             },
         ]
         
-        for booking_data in bookings_data:
-            # Calculate total price based on nights
-            nights = (booking_data['end_date'] - booking_data['start_date']).days
-            total_price = booking_data['listing'].price_per_night * nights
-            booking_data['total_price'] = total_price
-            
-            # Create booking (using booking_id as unique identifier)
-            booking = Booking.objects.create(**booking_data)
-            self.stdout.write(
-                f'  ✓ Created booking: {booking.user.username} → {booking.listing.title}'
+        # Build all Booking instances in memory, then insert them in a single
+        # query with bulk_create instead of one INSERT per booking. bulk_create
+        # skips Booking.save(), so snapshot the nightly price here; the
+        # database computes total_price from it
+        bookings = [
+            Booking(
+                listing=booking_data['listing'],
+                user=booking_data['user'],
+                start_date=booking_data['start_date'],
+                end_date=booking_data['end_date'],
+                status=booking_data['status'],
+                price_per_night=booking_data['listing'].price_per_night,
             )
+            for booking_data in bookings_data
+        ]
+        Booking.objects.bulk_create(bookings, batch_size=1000)
+        self.stdout.write(f'  ✓ Created {len(bookings)} bookings')
 
     def create_reviews(self, listings, users):
         """
@@ -266,9 +318,6 @@ class Command(BaseCommand):
             },
         ]
         
-        for review_data in reviews_data:
-            review = Review.objects.create(**review_data)
-            self.stdout.write(
-                f'  ✓ Created review: {review.rating}★ for {review.listing.title}'
-            )
-
+        reviews = [Review(**review_data) for review_data in reviews_data]
+        Review.objects.bulk_create(reviews, batch_size=1000)
+        self.stdout.write(f'  ✓ Created {len(reviews)} reviews')
@@ -1,56 +1,116 @@
 from django.db import models
-import uuid
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .utils import uuid7
 
 User = get_user_model()
 
 class Listing(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=255)
     description = models.TextField()
     price_per_night = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    # Indexed for the MAX(updated_at) lookup keying the listings list cache
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.title
 
+class DaysBetween(models.Func):
+    """
+    Whole days from one date to another, as an integer: DaysBetween(end, start).
+
+    Subtracting DateFields with F() gives a duration whose SQL differs per
+    backend, so spell out the integer day difference for each of them.
+    """
+    arg_joiner = ' - '
+    template = '(%(expressions)s)'
+    output_field = models.IntegerField()
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, template='DATEDIFF(%(expressions)s)',
+            arg_joiner=', ', **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='CAST(JULIANDAY(%(expressions)s) AS INTEGER)',
+            arg_joiner=') - JULIANDAY(', **extra_context
+        )
+
 class Booking(models.Model):
-    booking_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    booking_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
-    # FK to listing (property)
-    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='bookings')
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bookings')
+    # FK to listing (property). No single-column indexes: the composite
+    # indexes in Meta lead with these columns and cover the same lookups
+    listing = models.ForeignKey(
+        Listing, on_delete=models.CASCADE, related_name='bookings', db_index=False
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='bookings', db_index=False
+    )
 
     start_date = models.DateField()
     end_date = models.DateField()
 
-    total_price = models.DecimalField(max_digits=10, decimal_places=2)
+    # Nightly price of the listing when the booking was made, so later price
+    # changes don't alter existing bookings
+    price_per_night = models.DecimalField(max_digits=10, decimal_places=2)
 
-    STATUS_CHOICES = (
-        ('pending', 'Pending'),
-        ('confirmed', 'Confirmed'),
-        ('canceled', 'Cancelled'),
+    # Computed and stored by the database on insert/update
+    total_price = models.GeneratedField(
+        expression=models.F('price_per_night') * DaysBetween('end_date', 'start_date'),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
     )
 
-    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    # Stored as a small integer rather than a string, which keeps the
+    # column and the (user, status) index compact
+    class Status(models.IntegerChoices):
+        PENDING = 0, 'Pending'
+        CONFIRMED = 1, 'Confirmed'
+        CANCELED = 2, 'Cancelled'
+
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        pass
+        indexes = [
+            # Bookings of a listing within a date range
+            models.Index(fields=['listing', 'start_date']),
+            # A user's bookings filtered by status
+            models.Index(fields=['user', 'status']),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.price_per_night is None:
+            self.price_per_night = self.listing.price_per_night
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Booking {self.booking_id} for {self.listing.title}"
 
 class Review(models.Model):
-    review_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    listing = models.ForeignKey(Listing, on_delete=models.CASCADE, related_name='reviews')
+    review_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Indexed through (listing, rating) in Meta
+    listing = models.ForeignKey(
+        Listing, on_delete=models.CASCADE, related_name='reviews', db_index=False
+    )
 
     rating = models.IntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
 
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Covers per-listing review counts and rating aggregates without
+            # reading the table rows
+            models.Index(fields=['listing', 'rating']),
+        ]
+
     def __str__(self):
         return f"Review for {self.listing.title}"
\ No newline at end of file
@@ -2,33 +2,59 @@ from rest_framework import serializers
 from .models import Listing, Booking, Review
 
 class ListingSerializer(serializers.ModelSerializer):
-    # Counts the no. of related booking and Review objects
-    booking_count = serializers.SerializerMethodField()
-    review_count = serializers.SerializerMethodField()
+    # Counts of related Booking and Review objects. These are annotated onto
+    # the queryset by the view (see listings_queryset) so the counts come back
+    # with the listings in a single query instead of two COUNTs per listing
+    booking_count = serializers.IntegerField(read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Listing
-        fields = ['id', 'title', 'description', 'price_per_night', 
+        # description is left out of list responses, since it's the only
+        # potentially large column. ListingDetailSerializer adds it back
+        fields = ['id', 'title', 'price_per_night',
         'booking_count', 'review_count']
 
-        # Methods to calculate booking and review counts (format is get_<field_name>)
-    def get_booking_count(self, obj):
-        # The 'bookings' is the related_name set on FK in Booking Model
-        return obj.bookings.count()
-
-    def get_review_count(self, obj):
-        return obj.reviews.count()
+class ListingDetailSerializer(ListingSerializer):
+    class Meta(ListingSerializer.Meta):
+        fields = ['id', 'title', 'description', 'price_per_night', 
+        'booking_count', 'review_count']
 
 class BookingSerializer(serializers.ModelSerializer):
+    """
+    Serializes bookings with their listing title and user's username.
+
+    The queryset passed in should use select_related('listing', 'user') to
+    avoid a query per booking for each of them. Since only the title and
+    username are rendered, it can also defer the other related columns
+    with only('listing__title', 'user__username', ...).
+    """
     # Overrides the default PrimaryKeyRelatedField for 'listing'
-    # Calls the __str__ method of the Listing Model
-    listing = serializers.StringRelatedField()
-    user = serializers.StringRelatedField()
+    # Same output as Listing.__str__ / User.__str__, read straight off the field
+    listing = serializers.CharField(source='listing.title', read_only=True)
+    user = serializers.CharField(source='user.username', read_only=True)
+    # Generated column; declared explicitly so it keeps rendering as a
+    # decimal string like the other price fields
+    total_price = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    # Status is stored as a small integer; keep returning the
+    # 'pending'/'confirmed'/'canceled' strings clients already use. Spelled
+    # out rather than derived from the enum names so the wire format can't
+    # change by renaming a member
+    STATUS_LABELS = {
+        Booking.Status.PENDING: 'pending',
+        Booking.Status.CONFIRMED: 'confirmed',
+        Booking.Status.CANCELED: 'canceled',
+    }
+    status = serializers.SerializerMethodField()
     
     class Meta:
         model = Booking
         fields = ['booking_id', 'listing', 'user', 'start_date',
-         'end_date', 'total_price', 'status', 'created_at']
+         'end_date', 'price_per_night', 'total_price', 'status', 'created_at']
+
+    def get_status(self, obj):
+        # Unknown stored values render as null instead of failing the request
+        return self.STATUS_LABELS.get(obj.status)
 
 class ReviewSerializer(serializers.ModelSerializer):
     class Meta:
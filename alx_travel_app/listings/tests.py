@@ -1,3 +1,383 @@
-from django.test import TestCase
+import uuid
+from datetime import date
+from io import StringIO
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .management.commands.seed import Command as SeedCommand
+from .models import Booking, Listing, Review, User
+from .serializers import BookingSerializer
+from .utils import uuid7
+from .views import listings_cache_key, serialize_listings
+
+
+class UUID7Tests(SimpleTestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_embeds_millisecond_timestamp(self):
+        with mock.patch('listings.utils.time.time_ns', return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+    def test_successive_milliseconds_sort_in_order(self):
+        start_ns = 1_700_000_000_000_000_000
+        values = []
+        for ms in range(50):
+            with mock.patch('listings.utils.time.time_ns', return_value=start_ns + ms * 1_000_000):
+                values.append(uuid7())
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(len(set(values)), len(values))
+
+
+class ListingsTestCase(APITestCase):
+    """Shared fixture: one user and one listing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='guest', password='password123')
+        cls.listing = Listing.objects.create(
+            title='Villa', description='Sea view', price_per_night=Decimal('150.50')
+        )
+
+
+class BookingTotalPriceTests(ListingsTestCase):
+    def make_booking(self, **kwargs):
+        defaults = {
+            'listing': self.listing,
+            'user': self.user,
+            'start_date': date(2026, 1, 30),
+            'end_date': date(2026, 2, 2),
+        }
+        defaults.update(kwargs)
+        return Booking(**defaults)
+
+    def test_save_snapshots_listing_price(self):
+        booking = self.make_booking()
+        booking.save()
+        self.assertEqual(booking.price_per_night, Decimal('150.50'))
+
+        # Later listing price changes don't affect the booking
+        self.listing.price_per_night = Decimal('999.00')
+        self.listing.save()
+        booking.refresh_from_db()
+        self.assertEqual(booking.price_per_night, Decimal('150.50'))
+
+    def test_save_keeps_explicit_price(self):
+        booking = self.make_booking(price_per_night=Decimal('80.00'))
+        booking.save()
+        self.assertEqual(booking.price_per_night, Decimal('80.00'))
+
+    def test_total_price_computed_on_save(self):
+        booking = self.make_booking()
+        booking.save()
+        booking = Booking.objects.get(pk=booking.pk)
+        # 3 nights, across a month boundary
+        self.assertEqual(booking.total_price, Decimal('451.50'))
+        self.assertEqual(booking.total_price, booking.price_per_night * 3)
+
+    def test_total_price_computed_on_bulk_create(self):
+        bookings = [
+            self.make_booking(
+                start_date=date(2026, 3, 1),
+                end_date=date(2026, 3, 1 + nights),
+                price_per_night=Decimal('99.99'),
+            )
+            for nights in (1, 2, 7)
+        ]
+        Booking.objects.bulk_create(bookings)
+        for booking in bookings:
+            stored = Booking.objects.get(pk=booking.pk)
+            nights = (stored.end_date - stored.start_date).days
+            self.assertEqual(stored.total_price, stored.price_per_night * nights)
+
+    def test_total_price_updates_with_dates(self):
+        booking = self.make_booking()
+        booking.save()
+        booking.end_date = date(2026, 2, 4)
+        booking.save()
+        booking = Booking.objects.get(pk=booking.pk)
+        self.assertEqual(booking.total_price, Decimal('752.50'))
+
+
+class BookingSerializerTests(ListingsTestCase):
+    def test_status_rendered_as_string(self):
+        expected = {
+            Booking.Status.PENDING: 'pending',
+            Booking.Status.CONFIRMED: 'confirmed',
+            Booking.Status.CANCELED: 'canceled',
+        }
+        for status, label in expected.items():
+            booking = Booking.objects.create(
+                listing=self.listing, user=self.user, status=status,
+                start_date=date(2026, 1, 1), end_date=date(2026, 1, 2),
+            )
+            self.assertEqual(BookingSerializer(booking).data['status'], label)
+
+    def test_unknown_status_rendered_as_null(self):
+        booking = Booking(
+            listing=self.listing, user=self.user, status=9,
+            start_date=date(2026, 1, 1), end_date=date(2026, 1, 2),
+        )
+        self.assertIsNone(BookingSerializer(booking).data['status'])
+
+
+class ListingViewTests(ListingsTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Booking.objects.create(
+            listing=cls.listing, user=cls.user,
+            start_date=date(2026, 1, 1), end_date=date(2026, 1, 3),
+        )
+        Review.objects.create(listing=cls.listing, rating=5, comment='Great')
+        Review.objects.create(listing=cls.listing, rating=4, comment='Good')
+
+    def test_detail(self):
+        url = reverse('listings:detail', kwargs={'id': self.listing.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], str(self.listing.pk))
+        self.assertEqual(response.data['description'], 'Sea view')
+        self.assertEqual(response.data['booking_count'], 1)
+        self.assertEqual(response.data['review_count'], 2)
+
+    def test_detail_unknown_uuid(self):
+        url = reverse('listings:detail', kwargs={'id': uuid.uuid4()})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_detail_rejects_non_uuid(self):
+        response = self.client.get(reverse('listings:list') + '1/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_create(self):
+        data = {'title': 'Cabin', 'description': 'Quiet', 'price_per_night': '85.50'}
+        response = self.client.post(reverse('listings:create'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['title'], 'Cabin')
+        self.assertEqual(response.data['booking_count'], 0)
+        self.assertEqual(response.data['review_count'], 0)
+        self.assertTrue(Listing.objects.filter(pk=response.data['id']).exists())
+
+    def test_patch_is_partial(self):
+        url = reverse('listings:update', kwargs={'id': self.listing.pk})
+        response = self.client.patch(url, {'title': 'Beach Villa'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Beach Villa')
+        self.assertEqual(response.data['booking_count'], 1)
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.title, 'Beach Villa')
+        self.assertEqual(self.listing.description, 'Sea view')
+
+    def test_put_requires_all_fields(self):
+        url = reverse('listings:update', kwargs={'id': self.listing.pk})
+        response = self.client.put(url, {'title': 'Beach Villa'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('description', response.data)
+        self.assertIn('price_per_night', response.data)
+
+        data = {'title': 'Beach Villa', 'description': 'Ocean view', 'price_per_night': '175.00'}
+        response = self.client.put(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.description, 'Ocean view')
+        self.assertEqual(self.listing.price_per_night, Decimal('175.00'))
+
+    def test_delete(self):
+        url = reverse('listings:delete', kwargs={'id': self.listing.pk})
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Listing.objects.filter(pk=self.listing.pk).exists())
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ListingsListTests(ListingsTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Listing i gets i + 2 bookings and i + 3 reviews, so a joined count
+        # that multiplied the two would show up as a wrong number
+        cls.expected = {cls.listing.title: (0, 0)}
+        for i in range(3):
+            listing = Listing.objects.create(
+                title=f'Listing {i}', description='...', price_per_night=Decimal('100.00')
+            )
+            Booking.objects.bulk_create([
+                Booking(
+                    listing=listing, user=cls.user, price_per_night=listing.price_per_night,
+                    start_date=date(2026, 1, 1), end_date=date(2026, 1, 2),
+                )
+                for _ in range(i + 2)
+            ])
+            Review.objects.bulk_create([
+                Review(listing=listing, rating=5, comment='Great') for _ in range(i + 3)
+            ])
+            cls.expected[listing.title] = (i + 2, i + 3)
+
+    def test_single_query_with_counts(self):
+        with self.assertNumQueries(1):
+            data = serialize_listings()
+        counts = {item['title']: (item['booking_count'], item['review_count']) for item in data}
+        self.assertEqual(counts, self.expected)
+        self.assertNotIn('description', data[0])
+
+
+class BookingsListTests(ListingsTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        other_user = User.objects.create_user(username='host', password='password123')
+        cabin = Listing.objects.create(
+            title='Cabin', description='Quiet', price_per_night=Decimal('85.50')
+        )
+        cls.bookings = [
+            Booking.objects.create(
+                listing=cls.listing, user=cls.user, status=Booking.Status.CONFIRMED,
+                start_date=date(2026, 1, 1), end_date=date(2026, 1, 4),
+            ),
+            Booking.objects.create(
+                listing=cabin, user=other_user, status=Booking.Status.PENDING,
+                start_date=date(2026, 2, 1), end_date=date(2026, 2, 3),
+            ),
+            Booking.objects.create(
+                listing=cabin, user=cls.user, status=Booking.Status.CANCELED,
+                start_date=date(2026, 3, 1), end_date=date(2026, 3, 2),
+            ),
+        ]
+
+    def test_list_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('listings:bookings'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        rendered = {
+            item['booking_id']: (item['listing'], item['user'], item['status'], item['total_price'])
+            for item in response.data
+        }
+        self.assertEqual(rendered, {
+            str(self.bookings[0].pk): ('Villa', 'guest', 'confirmed', '451.50'),
+            str(self.bookings[1].pk): ('Cabin', 'host', 'pending', '171.00'),
+            str(self.bookings[2].pk): ('Cabin', 'guest', 'canceled', '85.50'),
+        })
+
+    def test_related_fields_match_titles_and_usernames(self):
+        response = self.client.get(reverse('listings:bookings'))
+        by_id = {item['booking_id']: item for item in response.data}
+        for booking in self.bookings:
+            item = by_id[str(booking.pk)]
+            # Same strings the previous StringRelatedField (__str__) output gave
+            self.assertEqual(item['listing'], booking.listing.title)
+            self.assertEqual(item['listing'], str(booking.listing))
+            self.assertEqual(item['user'], booking.user.username)
+            self.assertEqual(item['user'], str(booking.user))
+
+
+class ListingsListCacheTests(ListingsTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_list_served_from_cache(self):
+        url = reverse('listings:list')
+        response = self.client.get(url)
+        self.assertEqual([item['title'] for item in response.data], ['Villa'])
+        self.assertIsNotNone(cache.get(listings_cache_key()))
+
+        # A cache hit only runs the key lookup
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual([item['title'] for item in response.data], ['Villa'])
+
+    def test_key_changes_on_create(self):
+        key = listings_cache_key()
+        Listing.objects.create(title='Cabin', description='Quiet', price_per_night=Decimal('85.50'))
+        self.assertNotEqual(listings_cache_key(), key)
+
+    def test_key_changes_on_update(self):
+        key = listings_cache_key()
+        self.listing.title = 'Beach Villa'
+        self.listing.save()
+        self.assertNotEqual(listings_cache_key(), key)
+
+    def test_key_changes_on_delete(self):
+        Listing.objects.create(title='Cabin', description='Quiet', price_per_night=Decimal('85.50'))
+        key = listings_cache_key()
+        self.listing.delete()
+        self.assertNotEqual(listings_cache_key(), key)
+
+    def test_list_reflects_changes(self):
+        url = reverse('listings:list')
+        self.client.get(url)
+        Listing.objects.create(title='Cabin', description='Quiet', price_per_night=Decimal('85.50'))
+        response = self.client.get(url)
+        self.assertEqual(sorted(item['title'] for item in response.data), ['Cabin', 'Villa'])
+
+
+class SeedCommandTests(TestCase):
+    usernames = ['john_doe', 'jane_smith', 'bob_wilson']
+
+    def seed(self, *args):
+        call_command('seed', *args, stdout=StringIO())
+
+    def test_seed_twice_creates_no_duplicates(self):
+        self.seed()
+        self.seed()
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Listing.objects.count(), 5)
+        self.assertEqual(
+            Listing.objects.values('title').distinct().count(), Listing.objects.count()
+        )
+
+    def test_create_users_keeps_input_order(self):
+        command = SeedCommand(stdout=StringIO())
+        # Once creating every user, once finding them all already there
+        for _ in range(2):
+            users = command.create_users()
+            self.assertEqual([user.username for user in users], self.usernames)
+            self.assertTrue(all(user.pk for user in users))
+
+    def test_create_listings_keeps_input_order(self):
+        command = SeedCommand(stdout=StringIO())
+        first = command.create_listings()
+        second = command.create_listings()
+        self.assertEqual([listing.pk for listing in first], [listing.pk for listing in second])
+        self.assertEqual(first[0].title, 'Cozy Beachfront Villa')
+
+    def test_created_users_can_log_in(self):
+        self.seed()
+        self.assertTrue(User.objects.get(username='john_doe').check_password('password123'))
+
+    def test_failed_seed_leaves_nothing_behind(self):
+        with mock.patch.object(SeedCommand, 'create_reviews', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.seed()
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(Listing.objects.exists())
+        self.assertFalse(Booking.objects.exists())
+
+    def test_clear_resets_data_and_keeps_users(self):
+        self.seed()
+        self.seed('--clear')
+        self.assertEqual(Listing.objects.count(), 5)
+        self.assertEqual(Booking.objects.count(), 4)
+        self.assertEqual(Review.objects.count(), 5)
+        self.assertEqual(User.objects.count(), 3)
+
+    def test_clear_data_empties_tables(self):
+        self.seed()
+        SeedCommand(stdout=StringIO()).clear_data()
+        self.assertFalse(Review.objects.exists())
+        self.assertFalse(Booking.objects.exists())
+        self.assertFalse(Listing.objects.exists())
+        self.assertEqual(User.objects.count(), 3)
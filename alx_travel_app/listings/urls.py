@@ -5,8 +5,9 @@ app_name = 'listings'
 
 urlpatterns = [
     path('', views.listings_list, name='list'),
-    path('<int:id>/', views.listing_detail, name='detail'),
+    path('<uuid:id>/', views.listing_detail, name='detail'),
     path('create/', views.listing_create, name='create'),
-    path('<int:id>/update/', views.listing_update, name='update'),
-    path('<int:id>/delete/', views.listing_delete, name='delete'),
+    path('<uuid:id>/update/', views.listing_update, name='update'),
+    path('<uuid:id>/delete/', views.listing_delete, name='delete'),
+    path('bookings/', views.bookings_list, name='bookings'),
 ]
\ No newline at end of file
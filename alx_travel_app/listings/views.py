@@ -1,3 +1,112 @@
-from django.shortcuts import render
+from django.core.cache import cache
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
 
-# Create your views here.
+from .models import Listing, Booking, Review
+from .serializers import ListingSerializer, ListingDetailSerializer, BookingSerializer
+
+
+def related_count(model):
+    # COUNT of model rows pointing at the outer listing, as a correlated
+    # subquery. Coalesce turns "no rows" (NULL) into 0
+    rows = (
+        model.objects.filter(listing=OuterRef('pk'))
+        .values('listing')
+        .annotate(c=Count('pk'))
+        .values('c')
+    )
+    return Coalesce(Subquery(rows), 0)
+
+
+def listings_queryset():
+    # Annotate the related counts so ListingSerializer doesn't issue two COUNT
+    # queries per listing. Subqueries rather than Count() over the reverse
+    # joins, which would build a bookings x reviews product per listing
+    return Listing.objects.annotate(
+        booking_count=related_count(Booking),
+        review_count=related_count(Review),
+    )
+
+
+# Upper bound on how stale cached booking/review counts can get, since new
+# bookings and reviews don't touch Listing.updated_at
+LISTINGS_CACHE_TIMEOUT = 60
+
+
+def serialize_listings():
+    # Only load the columns ListingSerializer renders, leaving out the
+    # potentially large description
+    listings = listings_queryset().only('id', 'title', 'price_per_night')
+    return ListingSerializer(listings, many=True).data
+
+
+def listings_cache_key():
+    # Key the cached list on the latest listing change and the listing count,
+    # so creating, editing or deleting a listing serves a fresh list. COUNT(*)
+    # rather than COUNT(id) so the database can count from whichever index is
+    # cheapest (the updated_at index on MySQL/InnoDB)
+    state = Listing.objects.aggregate(last_updated=Max('updated_at'), total=Count('*'))
+    last_updated = state['last_updated'].timestamp() if state['last_updated'] else 0
+    return f"listings:v1:{last_updated}:{state['total']}"
+
+
+@api_view(['GET'])
+def listings_list(request):
+    data = cache.get_or_set(listings_cache_key(), serialize_listings, LISTINGS_CACHE_TIMEOUT)
+    return Response(data)
+
+
+@api_view(['GET'])
+def listing_detail(request, id):
+    # id arrives as a UUID from the <uuid:id> route, so this is a single
+    # primary key lookup
+    listing = get_object_or_404(listings_queryset(), pk=id)
+    serializer = ListingDetailSerializer(listing)
+    return Response(serializer.data)
+
+
+@api_view(['POST'])
+def listing_create(request):
+    serializer = ListingDetailSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    listing = serializer.save()
+    # A new listing has no bookings or reviews yet; set the counts the
+    # annotated queryset would give so the response matches detail/update
+    listing.booking_count = listing.review_count = 0
+    return Response(ListingDetailSerializer(listing).data, status=status.HTTP_201_CREATED)
+
+
+@api_view(['PUT', 'PATCH'])
+def listing_update(request, id):
+    listing = get_object_or_404(listings_queryset(), pk=id)
+    serializer = ListingDetailSerializer(
+        listing, data=request.data, partial=request.method == 'PATCH'
+    )
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+    return Response(serializer.data)
+
+
+@api_view(['DELETE'])
+def listing_delete(request, id):
+    listing = get_object_or_404(Listing, pk=id)
+    listing.delete()
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@api_view(['GET'])
+def bookings_list(request):
+    # select_related pulls the listing and user in the same query, since
+    # BookingSerializer renders both of them for every booking. only() trims
+    # that join down to the columns the serializer actually outputs
+    bookings = Booking.objects.select_related('listing', 'user').only(
+        'booking_id', 'start_date', 'end_date', 'price_per_night',
+        'total_price', 'status', 'created_at', 'listing__title',
+        'user__username',
+    )
+    serializer = BookingSerializer(bookings, many=True)
+    return Response(serializer.data)